@@ -1,29 +1,30 @@
 from typing import Any, Dict
-from threading import Lock
 import logging
 
 logger = logging.getLogger(__name__)
 
 
 class ThreadSafeResultStore:
-    """Thread-safe storage for results from parallel tasks"""
+    """
+    Storage for results from parallel tasks.
+
+    Each worker writes under its own distinct keys, and dict assignment of a
+    single key is atomic under the GIL, so no lock is needed on the write path.
+    Reads are expected once the executor has joined its workers.
+    """
 
     def __init__(self):
         self._results: Dict[str, Any] = {}
-        self._lock = Lock()
 
     def store(self, key: str, value: Any) -> None:
-        """Thread-safe store operation"""
-        with self._lock:
-            self._results[key] = value
-            logger.info(f"Stored result for key: {key}")
+        """Store a result under a key owned by the calling worker"""
+        self._results[key] = value
+        logger.info("Stored result for key: %s", key)
 
     def get(self, key: str) -> Any:
-        """Thread-safe get operation"""
-        with self._lock:
-            return self._results.get(key)
+        """Get a single result"""
+        return self._results.get(key)
 
     def get_all(self) -> Dict[str, Any]:
-        """Thread-safe get all results"""
-        with self._lock:
-            return self._results.copy()
+        """Get a snapshot of all results; call after workers have been joined"""
+        return dict(self._results)
@@ -1,68 +1,119 @@
-from typing import Sequence, Optional, Any
-from google.auth import aws as google_auth_aws
-from google.auth.transport.requests import Request
-from google.auth.credentials import Credentials
-from googleapiclient.discovery import build
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Sequence, Any
+from functools import lru_cache
 import logging
-from github import Github
-import threading
 from utils import safe_get_env
-import boto3
+
+# Heavy SDKs are imported where they are first used to keep cold starts cheap.
+if TYPE_CHECKING:
+    from google.auth.credentials import Credentials
+    from github import Github
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _orjson_model() -> Any:
+    """
+    A discovery JsonModel that decodes response bodies with orjson instead of
+    the stdlib json module. Large value ranges spend most of their parse time here.
+    """
+    import orjson
+    from googleapiclient.model import JsonModel
+
+    class OrjsonModel(JsonModel):
+        def deserialize(self, content: Any) -> Any:
+            body = orjson.loads(content)
+            if self._data_wrapper and isinstance(body, dict) and "data" in body:
+                body = body["data"]
+            return body
+
+    return OrjsonModel()
+
+
+@lru_cache(maxsize=None)
+def _github_client() -> Github:
+    from github import Github
+
+    logger.info("Initializing GithubClient...")
+    token = safe_get_env("GITHUB_TOKEN")
+    if not token:
+        logger.warning("GITHUB_TOKEN environment variable not set.")
+    client = Github(token)
+    logger.info("GithubClient initialized successfully.")
+    return client
+
+
+@lru_cache(maxsize=None)
+def _sheets_credentials() -> Credentials:
+    logger.info("Initializing SheetsClient...")
+    creds = SheetsClient._google_creds_from_env()
+    logger.info("SheetsClient initialized successfully.")
+    return creds
+
+
+@lru_cache(maxsize=None)
+def _sheets_service() -> Any:
+    """
+    One discovery service shared by all threads. Resource objects are
+    immutable once built; only httplib2.Http is not thread-safe, so each
+    request gets its own authorized transport instead.
+    """
+    from google_auth_httplib2 import AuthorizedHttp
+    from googleapiclient.discovery import build
+    from googleapiclient.http import HttpRequest, build_http
+
+    creds = _sheets_credentials()
+
+    # build_http() keeps the client's defaults: a 60s socket timeout and no
+    # 308 redirect following.
+    def build_request(http: Any, *args: Any, **kwargs: Any) -> HttpRequest:
+        return HttpRequest(AuthorizedHttp(creds, http=build_http()), *args, **kwargs)
+
+    # build() needs a transport (or credentials, from which it would make one);
+    # requests never use it because build_request ignores its `http` argument.
+    return build(
+        "sheets",
+        "v4",
+        http=AuthorizedHttp(creds, http=build_http()),
+        cache_discovery=False,
+        static_discovery=True,
+        model=_orjson_model(),
+        requestBuilder=build_request,
+    )
+
+
 class GithubClient:
-    _instance: Optional["GithubClient"] = None
-    _client: Optional[Github] = None
-
-    def __new__(cls) -> "GithubClient":
-        if cls._instance is None:
-            instance = super().__new__(cls)
-            instance._initialize()
-            cls._instance = instance
-        return cls._instance
-
-    def _initialize(self) -> None:
-        logger.info("Initializing GithubClient...")
-        token = safe_get_env("GITHUB_TOKEN")
-        if not token:
-            logger.warning("GITHUB_TOKEN environment variable not set.")
-        self._client = Github(token)
-        logger.info("GithubClient initialized successfully.")
+    """Thin handle over the process-wide Github client."""
+
+    def __init__(self) -> None:
+        self._client = _github_client()
 
     @property
     def client(self) -> Github:
-        if self._client is None:
-            raise RuntimeError("GithubClient not initialized.")
         return self._client
 
 
 class SheetsClient:
-    _instance: Optional["SheetsClient"] = None
-    _local = threading.local()
+    """Thin handle over the process-wide Google credentials and Sheets service."""
 
     SCOPES: Sequence[str] = [
         "https://www.googleapis.com/auth/spreadsheets.readonly",
     ]
 
-    def __new__(cls) -> "SheetsClient":
-        if cls._instance is None:
-            instance = super().__new__(cls)
-            instance._creds = None
-            instance._initialize()
-            cls._instance = instance
-        return cls._instance
-
-    def _initialize(self) -> None:
-        logger.info("Initializing SheetsClient...")
-        self._creds = self._google_creds_from_env()
-        logger.info("SheetsClient initialized successfully.")
+    def __init__(self) -> None:
+        self._creds = _sheets_credentials()
+        self._service = _sheets_service()
 
-    def _google_creds_from_env(self) -> Credentials:
+    @classmethod
+    def _google_creds_from_env(cls) -> Credentials:
         """
         Create Google credentials using AWS → Google Workload Identity Federation.
         """
+        from google.auth import aws as google_auth_aws
+        from google.auth.transport.requests import Request
+
         audience = safe_get_env("GOOGLE_WORKLOADIDENTITY_AUDIENCE")
         service_account = safe_get_env("GOOGLE_WORKLOADIDENTITY_SERVICEACCOUNT")
         region = safe_get_env("AWS_REGION") or safe_get_env("AWS_DEFAULT_REGION")
@@ -70,15 +121,19 @@ class SheetsClient:
         if not region:
             raise RuntimeError("AWS_REGION or AWS_DEFAULT_REGION must be set")
 
-        try:
-            sts = boto3.client("sts", region_name=region)
-            caller_identity = sts.get_caller_identity()
-            logger.info(f"AWS Caller Identity: {caller_identity['Arn']}")
-        except Exception as e:
-            logger.warning(f"Could not determine AWS Caller Identity: {e}")
+        # Diagnostic only; Google's WIF exchange signs its own GetCallerIdentity.
+        if logger.isEnabledFor(logging.DEBUG):
+            try:
+                import boto3
 
-        logger.info(f"Using Google WIF Audience: {audience}")
-        logger.info(f"Using Google Service Account: {service_account}")
+                sts = boto3.client("sts", region_name=region)
+                caller_identity = sts.get_caller_identity()
+                logger.debug("AWS Caller Identity: %s", caller_identity["Arn"])
+            except Exception as e:
+                logger.warning("Could not determine AWS Caller Identity: %s", e)
+
+        logger.info("Using Google WIF Audience: %s", audience)
+        logger.info("Using Google Service Account: %s", service_account)
 
         info = {
             "type": "external_account",
@@ -100,35 +155,82 @@ class SheetsClient:
 
         creds = google_auth_aws.Credentials.from_info(
             info,
-            scopes=list(self.SCOPES),
+            scopes=list(cls.SCOPES),
         )
         creds.refresh(Request())
-        logging.info(
+        logger.info(
             "Access token starts with: %s", creds.token[:10] if creds.token else "None"
         )
         return creds
 
-    def _get_thread_service(self) -> Any:
-        svc = getattr(self._local, "service", None)
-        if svc is None:
-            svc = build(
-                "sheets",
-                "v4",
-                credentials=self._creds,
-                cache_discovery=False,
-            )
-            self._local.service = svc
-        return svc
-
-    def get_values(self, spreadsheet_id: str, a1_range: str) -> list[list[str]]:
-        service = self._get_thread_service()
-        resp = (
-            service.spreadsheets()
-            .values()
-            .get(
-                spreadsheetId=spreadsheet_id,
-                range=a1_range,
+    def refresh_credentials(self) -> None:
+        """
+        Refresh the shared credentials if they have expired, e.g. on a warm
+        container past the WIF token TTL. Calling this once before fanning out
+        keeps every worker thread from refreshing on its first API call.
+        """
+        if self._creds.valid:
+            return
+        from google.auth.transport.requests import Request
+
+        logger.info("Refreshing expired Google credentials...")
+        self._creds.refresh(Request())
+
+    def batch_http(
+        self, requests: list[tuple[str, str, list[str]]]
+    ) -> tuple[dict[str, list[list[list[str]]]], dict[str, Exception]]:
+        """
+        Pack one values.batchGet per (tag, spreadsheet_id, ranges) into a single
+        HTTP batch request. Batch execution has no retry of its own, so any
+        sub-request that did not succeed (or all of them, if the batch itself
+        failed) is re-issued on its own with retries.
+
+        Returns (value ranges keyed by tag, errors keyed by tag); one failing
+        spreadsheet does not discard the others.
+        """
+        service = self._service
+        responses: dict[str, list[list[list[str]]]] = {}
+        failed: dict[str, Exception] = {}
+
+        def batch_get(spreadsheet_id: str, ranges: list[str]) -> Any:
+            return (
+                service.spreadsheets()
+                .values()
+                .batchGet(
+                    spreadsheetId=spreadsheet_id,
+                    ranges=ranges,
+                )
             )
-            .execute(num_retries=5)
-        )
-        return resp.get("values", [])
+
+        def value_ranges(response: Any) -> list[list[list[str]]]:
+            return [vr.get("values", []) for vr in response.get("valueRanges", [])]
+
+        def callback(request_id: str, response: Any, exception: Any) -> None:
+            if exception is not None:
+                failed[request_id] = exception
+                return
+            responses[request_id] = value_ranges(response)
+
+        batch = service.new_batch_http_request(callback=callback)
+        for tag, spreadsheet_id, ranges in requests:
+            batch.add(batch_get(spreadsheet_id, ranges), request_id=tag)
+        try:
+            batch.execute()
+        except Exception as e:
+            logger.warning("Batch request failed, retrying individually: %s", e)
+
+        errors: dict[str, Exception] = {}
+        for tag, spreadsheet_id, ranges in requests:
+            if tag in responses:
+                continue
+            if tag in failed:
+                logger.warning(
+                    "Batch sub-request '%s' failed, retrying: %s", tag, failed[tag]
+                )
+            try:
+                response = batch_get(spreadsheet_id, ranges).execute(num_retries=5)
+                responses[tag] = value_ranges(response)
+            except Exception as e:
+                logger.error("Sheets request '%s' failed: %s", tag, e)
+                errors[tag] = e
+        return responses, errors
@@ -1,29 +1,58 @@
-from outputs import (
-    FinanceSummary,
-    FinanceTrajectory,
-    FinanceTransactions,
-    RecruitmentSummary,
-    RecruitmentNPO_CRM,
-    RecruitmentSponsor_CRM,
-)
+from enum import Enum
+from functools import lru_cache
+from typing import Mapping, Type
 from models import FinanceSheet, SheetSpec, RecruitmentSheet
 
-FINANCE_SPECS: dict[FinanceSheet, SheetSpec[object]] = {
-    FinanceSheet.SUMMARY: SheetSpec(parse=FinanceSummary.parse_finance_summary),
-    FinanceSheet.TRAJECTORY: SheetSpec(
-        parse=FinanceTrajectory.parse_finance_trajectory
-    ),
-    FinanceSheet.TRANSACTIONS: SheetSpec(
-        parse=FinanceTransactions.parse_finance_transactions
-    ),
-}
-
-RECRUITMENT_SPECS: dict[RecruitmentSheet, SheetSpec[object]] = {
-    RecruitmentSheet.SUMMARY: SheetSpec(
-        parse=RecruitmentSummary.parse_recruitment_summary
-    ),
-    RecruitmentSheet.NPO_CRM: SheetSpec(parse=RecruitmentNPO_CRM.parse_npo_crm),
-    RecruitmentSheet.SPONSORS_CRM: SheetSpec(
-        parse=RecruitmentSponsor_CRM.parse_sponsor_crm
-    ),
-}
+
+def _ordered_specs(
+    sheet_enum: Type[Enum], specs: Mapping[Enum, SheetSpec[object]]
+) -> tuple[SheetSpec[object], ...]:
+    """
+    Lay specs out in enum definition order so callers iterating the enum can
+    zip against them instead of looking each sheet up.
+    """
+    missing = [sheet for sheet in sheet_enum if sheet not in specs]
+    if missing:
+        raise KeyError(f"No parser registered for {missing}")
+    return tuple(specs[sheet] for sheet in sheet_enum)
+
+
+# Parsers are imported on first use so cold starts only pay for what runs.
+@lru_cache(maxsize=None)
+def finance_specs() -> tuple[SheetSpec[object], ...]:
+    from outputs import FinanceSummary, FinanceTrajectory, FinanceTransactions
+
+    return _ordered_specs(
+        FinanceSheet,
+        {
+            FinanceSheet.SUMMARY: SheetSpec(parse=FinanceSummary.parse_finance_summary),
+            FinanceSheet.TRAJECTORY: SheetSpec(
+                parse=FinanceTrajectory.parse_finance_trajectory
+            ),
+            FinanceSheet.TRANSACTIONS: SheetSpec(
+                parse=FinanceTransactions.parse_finance_transactions
+            ),
+        },
+    )
+
+
+@lru_cache(maxsize=None)
+def recruitment_specs() -> tuple[SheetSpec[object], ...]:
+    from outputs import (
+        RecruitmentSummary,
+        RecruitmentNPO_CRM,
+        RecruitmentSponsor_CRM,
+    )
+
+    return _ordered_specs(
+        RecruitmentSheet,
+        {
+            RecruitmentSheet.SUMMARY: SheetSpec(
+                parse=RecruitmentSummary.parse_recruitment_summary
+            ),
+            RecruitmentSheet.NPO_CRM: SheetSpec(parse=RecruitmentNPO_CRM.parse_npo_crm),
+            RecruitmentSheet.SPONSORS_CRM: SheetSpec(
+                parse=RecruitmentSponsor_CRM.parse_sponsor_crm
+            ),
+        },
+    )
@@ -1,27 +1,124 @@
-import urllib.request
+from typing import Any, Iterator
+import dataclasses
+from functools import lru_cache
+import urllib3
 import logging
-import json
+import time
+import orjson
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Shared across calls so repeated posts reuse the TLS connection.
+_pool = urllib3.PoolManager(num_pools=1, maxsize=1)
+
+DISCORD_MESSAGE_LIMIT = 2000
+DISCORD_MAX_RATE_LIMIT_RETRIES = 3
+
+_HEADERS = {
+    "Content-Type": "application/json",
+    "User-Agent": "BlueprintMetricsLambda/1.0",
+}
+
+
+@lru_cache(maxsize=None)
+def _uses_dataclass_repr(cls: type) -> bool:
+    """
+    True if instances of a dataclass format through the dataclass-generated
+    __repr__ (and object.__str__), i.e. str(obj) is the field-by-field repr.
+    The generated method is compiled from source text, so its code object
+    reports "<string>" as its file; a __repr__ written in the class does not.
+    """
+    if not cls.__dataclass_params__.repr or cls.__str__ is not object.__str__:
+        return False
+    fn = getattr(cls.__repr__, "__wrapped__", cls.__repr__)
+    code = getattr(fn, "__code__", None)
+    return code is not None and code.co_filename == "<string>"
+
+
+def _expandable(obj: Any) -> bool:
+    return type(obj) is list or (
+        dataclasses.is_dataclass(obj)
+        and not isinstance(obj, type)
+        and _uses_dataclass_repr(type(obj))
+    )
+
+
+def _iter_repr(obj: Any) -> Iterator[str]:
+    """
+    repr(obj) in order, as a stream of chunks. Lists and dataclasses are
+    expanded item by item so a consumer can stop early on large results.
+    """
+    if not _expandable(obj):
+        yield repr(obj)
+    elif type(obj) is list:
+        yield "["
+        for i, item in enumerate(obj):
+            if i:
+                yield ", "
+            yield from _iter_repr(item)
+        yield "]"
+    else:
+        yield type(obj).__qualname__ + "("
+        fields = [f for f in dataclasses.fields(obj) if f.repr]
+        for i, f in enumerate(fields):
+            yield f"{', ' if i else ''}{f.name}="
+            yield from _iter_repr(getattr(obj, f.name))
+        yield ")"
+
+
+def format_discord_message(key: str, result: Any) -> str:
+    """
+    Render f"**{key}**: {result}", cut to DISCORD_MESSAGE_LIMIT chars with a
+    trailing "...", without stringifying the whole (possibly very large)
+    result first. The output is identical to formatting it in full.
+    """
+    parts = [f"**{key}**: "]
+    used = len(parts[0])
+    # str() of a list or dataclass is its repr; anything else is formatted whole.
+    chunks = _iter_repr(result) if _expandable(result) else iter([str(result)])
+    for chunk in chunks:
+        parts.append(chunk)
+        used += len(chunk)
+        if used > DISCORD_MESSAGE_LIMIT:
+            break
+    message = "".join(parts)
+    if len(message) > DISCORD_MESSAGE_LIMIT:
+        message = message[: DISCORD_MESSAGE_LIMIT - 3] + "..."
+    return message
+
+
+def _retry_after(resp: Any) -> float:
+    """Seconds to wait before retrying a rate-limited (429) webhook post."""
+    header = resp.headers.get("Retry-After")
+    if header is not None:
+        return float(header)
+    try:
+        return float(orjson.loads(resp.data).get("retry_after", 1.0))
+    except (orjson.JSONDecodeError, AttributeError, TypeError, ValueError):
+        return 1.0
+
 
 def send_discord_message(webhook_url: str, message: str) -> None:
-    """Sends a message to a Discord channel via webhook."""
-    data = {"content": message}
-    payload = json.dumps(data).encode("utf-8")
+    """
+    Sends a message to a Discord channel via webhook, waiting out
+    rate limits (HTTP 429) for up to DISCORD_MAX_RATE_LIMIT_RETRIES retries.
+    """
+    payload = b'{"content":' + orjson.dumps(message) + b"}"
     logger.info(f"Discord payload: {payload}")
 
-    req = urllib.request.Request(
-        webhook_url,
-        data=payload,
-        headers={
-            "Content-Type": "application/json",
-            "User-Agent": "BlueprintMetricsLambda/1.0",
-        },
-    )
     try:
-        urllib.request.urlopen(req)
+        for attempt in range(DISCORD_MAX_RATE_LIMIT_RETRIES + 1):
+            resp = _pool.request("POST", webhook_url, body=payload, headers=_HEADERS)
+            if resp.status != 429 or attempt == DISCORD_MAX_RATE_LIMIT_RETRIES:
+                break
+            delay = _retry_after(resp)
+            logger.warning("Discord rate limited; retrying in %.2fs", delay)
+            time.sleep(delay)
+        if resp.status >= 400:
+            raise RuntimeError(
+                f"Discord webhook returned HTTP {resp.status}: {resp.data[:200]!r}"
+            )
         logger.info("Discord message sent successfully.")
     except Exception as e:
         logger.error(f"Failed to send Discord message: {e}", exc_info=True)
@@ -1,44 +1,79 @@
+from enum import Enum
+from typing import Sequence, TypeVar
 from clients import SheetsClient
-from models import FinanceSheet, FinanceConfig, RecruitmentSheet, RecruitmentConfig
-from configs import FINANCE_SPECS, RECRUITMENT_SPECS
+from models import (
+    FinanceSheet,
+    FinanceConfig,
+    RecruitmentSheet,
+    RecruitmentConfig,
+    SheetSpec,
+)
+from configs import finance_specs, recruitment_specs
 import logging
 
 logger = logging.getLogger(__name__)
 
+E = TypeVar("E", bound=Enum)
 
-def fetch_finance_sheet(
-    client: SheetsClient,
-    cfg: FinanceConfig,
-    sheet: FinanceSheet,
-):
-    logger.info(f"Fetching finance sheet: {sheet.value}")
-    sheet_cfg = cfg.get(sheet)
-
-    raw = client.get_values(cfg.spreadsheet_id, sheet_cfg.full_range)
-    logger.info(f"Fetched {len(raw)} rows for finance sheet: {sheet.value}")
+FINANCE_TAG = "finance"
+RECRUITMENT_TAG = "recruitment"
 
-    spec = FINANCE_SPECS.get(sheet)
-    if spec is None:
-        logger.error(f"No parser registered for finance sheet: {sheet}")
-        raise KeyError(f"No parser registered for {sheet}")
 
-    return spec.parse(raw)
+def _parse_sheets(
+    kind: str,
+    sheets: Sequence[E],
+    raws: Sequence[list[list[str]]],
+    specs: Sequence[SheetSpec[object]],
+) -> dict[E, object]:
+    """`sheets`, `raws` and `specs` are parallel, in enum definition order."""
+    results: dict[E, object] = {}
+    for sheet, raw, spec in zip(sheets, raws, specs):
+        logger.info("Fetched %d rows for %s sheet: %s", len(raw), kind, sheet.value)
+        results[sheet] = spec.parse(raw)
+    return results
 
 
-def fetch_recruitment_sheet(
+def fetch_all_sheets(
     client: SheetsClient,
-    cfg: RecruitmentConfig,
-    sheet: RecruitmentSheet,
-):
-    logger.info(f"Fetching recruitment sheet: {sheet.value}")
-    sheet_cfg = cfg.get(sheet)
+    finance_cfg: FinanceConfig,
+    recruitment_cfg: RecruitmentConfig,
+) -> tuple[dict[str, dict[Enum, object]], dict[str, Exception]]:
+    """
+    Fetch every finance and recruitment range in a single HTTP batch request,
+    then dispatch each returned matrix to its registered parser.
 
-    raw = client.get_values(cfg.spreadsheet_id, sheet_cfg.full_range)
-    logger.info(f"Fetched {len(raw)} rows for finance sheet: {sheet.value}")
+    Returns (parsed sheets, errors), both keyed by FINANCE_TAG/RECRUITMENT_TAG;
+    each spreadsheet succeeds or fails independently of the other.
+    """
+    finance_sheets = list(FinanceSheet)
+    recruitment_sheets = list(RecruitmentSheet)
+    logger.info("Fetching finance and recruitment sheets")
 
-    spec = RECRUITMENT_SPECS.get(sheet)
-    if spec is None:
-        logger.error(f"No parser registered for recruitment sheet: {sheet}")
-        raise KeyError(f"No parser registered for {sheet}")
+    raws, errors = client.batch_http(
+        [
+            (
+                FINANCE_TAG,
+                finance_cfg.spreadsheet_id,
+                [finance_cfg.full_range(sheet) for sheet in finance_sheets],
+            ),
+            (
+                RECRUITMENT_TAG,
+                recruitment_cfg.spreadsheet_id,
+                [recruitment_cfg.full_range(sheet) for sheet in recruitment_sheets],
+            ),
+        ]
+    )
 
-    return spec.parse(raw)
+    parsed: dict[str, dict[Enum, object]] = {}
+    for tag, sheets, specs in (
+        (FINANCE_TAG, finance_sheets, finance_specs()),
+        (RECRUITMENT_TAG, recruitment_sheets, recruitment_specs()),
+    ):
+        if tag not in raws:
+            continue
+        try:
+            parsed[tag] = _parse_sheets(tag, sheets, raws[tag], specs)
+        except Exception as e:
+            logger.error("Failed to parse %s sheets: %s", tag, e)
+            errors[tag] = e
+    return parsed, errors
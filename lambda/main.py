@@ -3,12 +3,10 @@ from parser import parse_config
 import json
 import logging
 from models import (
-    FinanceSheet,
-    RecruitmentSheet,
     FinanceConfig,
     RecruitmentConfig,
 )
-from fetch import fetch_finance_sheet, fetch_recruitment_sheet
+from fetch import FINANCE_TAG, RECRUITMENT_TAG, fetch_all_sheets
 from services import GithubService
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from ThreadSafeResultStore import ThreadSafeResultStore
@@ -18,7 +16,7 @@ from utils import (
     is_var_in_env,
     safe_get_env,
 )
-from discord import send_discord_message
+from discord import format_discord_message, send_discord_message
 
 CONFIG_PATH = "config.json"
 logging.basicConfig(
@@ -27,30 +25,38 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def get_finance_metrics(
-    sheets_client: SheetsClient,
-    finance_cfg: FinanceConfig,
-    result_store: ThreadSafeResultStore,
-) -> None:
-    for sheet in FinanceSheet:
-        logger.info(f"Processing sheet: {sheet}")
-        result = fetch_finance_sheet(sheets_client, finance_cfg, sheet)
-        result_store.store(sheet.value, result)
-        logger.info(f"Completed sheet: {sheet}")
-        logger.info(result)
+def _prewarm_clients() -> None:
+    """
+    Build the cached clients (imports, discovery parse, WIF token) during the
+    Lambda init phase rather than on billed handler time. Failures are left
+    for the handler to retry and report.
+    """
+    try:
+        SheetsClient()
+        GithubClient()
+    except Exception:
+        logger.warning("Client pre-warm failed; deferring to handler.", exc_info=True)
 
 
-def get_recruitment_metrics(
+if is_var_in_env("PROD"):
+    _prewarm_clients()
+
+
+def get_sheets_metrics(
     sheets_client: SheetsClient,
+    finance_cfg: FinanceConfig,
     recruitment_cfg: RecruitmentConfig,
     result_store: ThreadSafeResultStore,
-) -> None:
-    for sheet in RecruitmentSheet:
-        logger.info(f"Processing sheet: {sheet}")
-        result = fetch_recruitment_sheet(sheets_client, recruitment_cfg, sheet)
-        result_store.store(sheet.value, result)
-        logger.info(f"Completed sheet: {sheet}")
-        logger.info(result)
+) -> dict[str, Exception]:
+    """Store every parsed sheet; returns the per-spreadsheet failures by tag."""
+    parsed, errors = fetch_all_sheets(sheets_client, finance_cfg, recruitment_cfg)
+    for results in parsed.values():
+        for sheet, result in results.items():
+            result_store.store(sheet.value, result)
+            logger.info("Completed sheet: %s", sheet)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(result)
+    return errors
 
 
 def get_github_metrics(
@@ -59,7 +65,7 @@ def get_github_metrics(
     logger.info("Generating weekly GitHub metrics")
     reports = github_service.generate_weekly_metrics()
     for report in reports:
-        logger.info(f"Metrics computed for team: {report.team_name}")
+        logger.info("Metrics computed for team: %s", report.team_name)
         result_store.store(report.team_name, report)
     logger.info("Completed GitHub metrics generation")
 
@@ -75,49 +81,60 @@ def handler(event, context):
         recruitment_cfg, finance_cfg, github_cfg = parse_config(config_data)
 
         sheets_client = SheetsClient()
+        sheets_client.refresh_credentials()
         github_client = GithubClient()
         github_service = GithubService(github_client, github_cfg)
         results_store = ThreadSafeResultStore()
 
-        with ThreadPoolExecutor(max_workers=3) as executor:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            sheets_future = executor.submit(
+                get_sheets_metrics,
+                sheets_client,
+                finance_cfg,
+                recruitment_cfg,
+                results_store,
+            )
+            github_future = executor.submit(
+                get_github_metrics, github_service, results_store
+            )
             futures = {
-                executor.submit(
-                    get_finance_metrics, sheets_client, finance_cfg, results_store
-                ): "finance",
-                executor.submit(
-                    get_recruitment_metrics,
-                    sheets_client,
-                    recruitment_cfg,
-                    results_store,
-                ): "recruitment",
-                executor.submit(
-                    get_github_metrics, github_service, results_store
-                ): "github",
+                sheets_future: (FINANCE_TAG, RECRUITMENT_TAG),
+                github_future: ("github",),
             }
 
             results = {}
             errors = []
 
+            # A future may cover several tasks (both spreadsheets share one batch
+            # request); it returns the failures of any it did not complete.
             for future in as_completed(futures):
-                task_name = futures[future]
+                task_names = futures[future]
                 try:
-                    future.result()
-                    results[task_name] = "success"
-                    logger.info(f"Task '{task_name}' completed successfully")
+                    failures = future.result() or {}
                 except Exception as e:
-                    error_msg = f"Task '{task_name}' failed: {str(e)}"
-                    logger.exception(error_msg)
+                    failures = {task_name: e for task_name in task_names}
+                for task_name in task_names:
+                    error = failures.get(task_name)
+                    if error is None:
+                        results[task_name] = "success"
+                        logger.info("Task '%s' completed successfully", task_name)
+                        continue
+                    error_msg = f"Task '{task_name}' failed: {str(error)}"
+                    logger.error(error_msg, exc_info=error)
                     results[task_name] = "failed"
                     errors.append(error_msg)
 
         all_results = results_store.get_all()
-        logger.info(all_results)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(all_results)
 
         webhook_url = safe_get_env("DISCORD_WEBHOOK_URL")
-        for key, result in all_results.items():
-            message = f"**{key}**: {result}"
-            if len(message) > 2000:
-                message = message[:1997] + "..."
+        messages = [
+            format_discord_message(key, result) for key, result in all_results.items()
+        ]
+
+        # Sequential, so messages land in order and stay under the webhook rate limit
+        for message in messages:
             send_discord_message(webhook_url=webhook_url, message=message)
 
         logger.info("Finished successfully.")
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Sequence, List
+from typing import Any, Callable, Sequence, List
 import logging
 from utils import _to_float, _as_int, _as_float
 from models import TransactionRecord, CurrentGoalWrapper, RecruitmentNPO, Sponsor
@@ -7,7 +7,7 @@ from models import TransactionRecord, CurrentGoalWrapper, RecruitmentNPO, Sponso
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FinanceSummary:
     total_budget: float
     total_spent: float
@@ -24,15 +24,22 @@ class FinanceSummary:
         ["Total Spent", "789.00"]
         ...
         """
-        # Turn 2-column rows into a map: label -> value
-        kv: dict[str, Any] = {}
+        # Single pass over 2-column rows, keeping the last value per known label
+        budget_raw = spent_raw = pending_raw = None
         for row in values:
-            if len(row) >= 2 and row[0] is not None:
-                kv[str(row[0]).strip().lower()] = row[1]
-
-        total_budget = _to_float(kv.get("total budget"))
-        total_spent = _to_float(kv.get("total spent"))
-        pending = _to_float(kv.get("pending reimbursements"))
+            if len(row) < 2 or row[0] is None:
+                continue
+            label = str(row[0]).strip().lower()
+            if label == "total budget":
+                budget_raw = row[1]
+            elif label == "total spent":
+                spent_raw = row[1]
+            elif label == "pending reimbursements":
+                pending_raw = row[1]
+
+        total_budget = _to_float(budget_raw)
+        total_spent = _to_float(spent_raw)
+        pending = _to_float(pending_raw)
 
         utilization = (total_spent / total_budget) if total_budget else 0.0
 
@@ -44,7 +51,7 @@ class FinanceSummary:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FinanceTrajectory:
     week: int
     week_ending: str
@@ -88,14 +95,17 @@ class FinanceTrajectory:
                 trajectories.append(trajectory)
             except (ValueError, TypeError) as e:
                 logger.warning(
-                    f"Skipping invalid finance trajectory row {i}: {row}. Error: {e}"
+                    "Skipping invalid finance trajectory row %d: %r. Error: %s",
+                    i,
+                    row,
+                    e,
                 )
                 continue  # Skip rows with invalid data
 
         return trajectories
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FinanceTransactions:
     transactions: List[TransactionRecord]
 
@@ -140,14 +150,37 @@ class FinanceTransactions:
                 transactions.append(record)
             except (ValueError, TypeError) as e:
                 logger.warning(
-                    f"Skipping invalid transaction row {i}: {row}. Error: {e}"
+                    "Skipping invalid transaction row %d: %r. Error: %s", i, row, e
                 )
                 continue  # Skip rows with invalid data
 
         return FinanceTransactions(transactions=transactions)
 
 
-@dataclass(frozen=True)
+def _current_goal_int(current: Any, goal: Any) -> CurrentGoalWrapper[int]:
+    return CurrentGoalWrapper(current=_as_int(current, 0), goal=_as_int(goal, 0))
+
+
+def _current_goal_float(current: Any, goal: Any) -> CurrentGoalWrapper[float]:
+    return CurrentGoalWrapper(
+        current=_as_float(current, 0.0), goal=_as_float(goal, 0.0)
+    )
+
+
+# Sheet label (lowercased) -> (RecruitmentSummary field, converter), in field order
+_RECRUITMENT_SUMMARY_FIELDS: dict[
+    str, tuple[str, Callable[[Any, Any], CurrentGoalWrapper[Any]]]
+] = {
+    "npos contacted": ("npos_contacted", _current_goal_int),
+    "npos recruited": ("npos_recruited", _current_goal_int),
+    "sponsors contacted": ("sponsors_contacted", _current_goal_int),
+    "sponsorship secured": ("sponsorship_secured", _current_goal_float),
+    "applications received": ("applicatuibs_received", _current_goal_int),
+    "challenges submitted": ("challenges_submitted", _current_goal_int),
+}
+
+
+@dataclass(frozen=True, slots=True)
 class RecruitmentSummary:
     npos_contacted: CurrentGoalWrapper[int]
     npos_recruited: CurrentGoalWrapper[int]
@@ -168,36 +201,30 @@ class RecruitmentSummary:
         ["NPOs Recruited", "30", "80"]
         ...
         """
-        # Turn 2 or 3-column rows into a map: label -> (current, goal)
-        kv: dict[str, tuple[Any, Any]] = {}
+        # Single pass over 2 or 3-column rows, converting known labels as they
+        # are seen. Only the last row per label counts, so a conversion error
+        # is kept in place of the value and raised only if no later row replaces it.
+        converted: dict[str, Any] = {}
         for row in values:
-            if len(row) >= 2 and row[0] is not None:
-                current = row[1]
-                goal = row[2] if len(row) >= 3 else None
-                kv[str(row[0]).strip().lower()] = (current, goal)
-
-        def to_current_goal(label: str) -> CurrentGoalWrapper[int]:
-            current, goal = kv.get(label, (0, 0))
-            return CurrentGoalWrapper(
-                current=_as_int(current, 0),
-                goal=_as_int(goal, 0),
-            )
-
-        def to_current_goal_float(label: str) -> CurrentGoalWrapper[float]:
-            current, goal = kv.get(label, (0.0, 0.0))
-            return CurrentGoalWrapper(
-                current=_as_float(current, 0.0),
-                goal=_as_float(goal, 0.0),
-            )
-
-        return RecruitmentSummary(
-            npos_contacted=to_current_goal("npos contacted"),
-            npos_recruited=to_current_goal("npos recruited"),
-            sponsors_contacted=to_current_goal("sponsors contacted"),
-            sponsorship_secured=to_current_goal_float("sponsorship secured"),
-            applicatuibs_received=to_current_goal("applications received"),
-            challenges_submitted=to_current_goal("challenges submitted"),
-        )
+            if len(row) < 2 or row[0] is None:
+                continue
+            entry = _RECRUITMENT_SUMMARY_FIELDS.get(str(row[0]).strip().lower())
+            if entry is None:
+                continue
+            field, convert = entry
+            try:
+                converted[field] = convert(row[1], row[2] if len(row) >= 3 else None)
+            except (ValueError, TypeError) as e:
+                converted[field] = e
+
+        for field, convert in _RECRUITMENT_SUMMARY_FIELDS.values():
+            value = converted.get(field)
+            if value is None:
+                converted[field] = convert(0, 0)
+            elif isinstance(value, Exception):
+                raise value
+
+        return RecruitmentSummary(**converted)
 
 
 class RecruitmentNPO_CRM:
@@ -246,7 +273,7 @@ class RecruitmentNPO_CRM:
                 npos.append(npo)
             except (ValueError, TypeError) as e:
                 logger.warning(
-                    f"Skipping invalid NPO CRM row {i}: {row}. Error: {e}"
+                    "Skipping invalid NPO CRM row %d: %r. Error: %s", i, row, e
                 )
                 continue  # Skip rows with invalid data
 
@@ -302,7 +329,7 @@ class RecruitmentSponsor_CRM:
                 sponsors.append(sponsor)
             except (ValueError, TypeError) as e:
                 logger.warning(
-                    f"Skipping invalid sponsor CRM row {i}: {row}. Error: {e}"
+                    "Skipping invalid sponsor CRM row %d: %r. Error: %s", i, row, e
                 )
                 continue  # Skip rows with invalid data
 
@@ -1,5 +1,6 @@
-from typing import Any, Dict, Mapping, Type, TypeVar
+from typing import Any, Dict, FrozenSet, Mapping, Tuple, Type, TypeVar
 from enum import Enum
+from functools import lru_cache
 import logging
 from models import (
     SheetConfig,
@@ -18,6 +19,13 @@ logger = logging.getLogger(__name__)
 E = TypeVar("E", bound=Enum)
 
 
+@lru_cache(maxsize=None)
+def _enum_keys(sheet_enum: Type[E]) -> Tuple[Tuple[E, ...], FrozenSet[str]]:
+    """Members of a sheet enum and the config keys allowed alongside them."""
+    members = tuple(sheet_enum)
+    return members, frozenset(e.value for e in members) | {"spreadsheet_id"}
+
+
 def _parse_github_config(raw: Mapping[str, Any]) -> GithubConfig:
     try:
         organization = raw["organization"]
@@ -67,8 +75,9 @@ def _parse_spreadsheet_config(
         raise ValueError("Missing required key: spreadsheet_id") from e
 
     sheet_configs: Dict[E, SheetConfig] = {}
+    members, allowed_keys = _enum_keys(sheet_enum)
 
-    for key in sheet_enum:
+    for key in members:
         key_name = key.value
         if key_name not in raw:
             logger.error(f"Missing sheet config '{key_name}' for {sheet_enum.__name__}")
@@ -91,8 +100,7 @@ def _parse_spreadsheet_config(
                 f"Invalid sheet config for '{key_name}', missing {e}"
             ) from e
 
-    allowed_keys = {e.value for e in sheet_enum} | {"spreadsheet_id"}
-    extra_keys = set(raw.keys()) - allowed_keys
+    extra_keys = raw.keys() - allowed_keys
     if extra_keys:
         logger.warning(
             f"Unknown sheet keys for {sheet_enum.__name__}: {sorted(extra_keys)}"
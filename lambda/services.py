@@ -1,7 +1,8 @@
 import logging
-import logging
-from typing import List, Dict, Tuple
+from typing import Any, List, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from statistics import fmean
 from clients import GithubClient
 from models import (
     GithubConfig,
@@ -12,12 +13,171 @@ from models import (
     NPOMetrics,
     AlertMetrics,
     RawTeamMetrics,
+    PullRequestRecord,
+    PullReview,
 )
 
 logger = logging.getLogger(__name__)
 NPO_LABEL = "NPO-Feature"
 STALE_PR_DAYS = 7
 STALE_ISSUE_DAYS = 10
+SECONDS_PER_DAY = 86400
+SECONDS_PER_HOUR = 3600
+GITHUB_MAX_WORKERS = 8
+
+
+def _epoch(dt: datetime) -> float:
+    """
+    POSIX seconds for a GitHub timestamp. PyGithub 2.x returns aware UTC
+    datetimes; naive ones are treated as UTC, as the API guarantees.
+    """
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+# Fetch helpers run on executor threads. Each one logs and swallows its own
+# errors so one bad repo or PR does not poison the rest of the batch.
+
+
+def _fetch_repo(g: Any, name: str) -> Optional[Any]:
+    try:
+        return g.get_repo(name)
+    except Exception as e:
+        logger.error(f"Error fetching repo {name}: {e}")
+        return None
+
+
+_RECENT_PULLS_QUERY = """
+query($q: String!, $cursor: String) {
+  search(query: $q, type: ISSUE, first: 100, after: $cursor) {
+    pageInfo { hasNextPage endCursor }
+    nodes {
+      ... on PullRequest {
+        id
+        number
+        state
+        merged
+        createdAt
+        updatedAt
+        closedAt
+        author { login }
+        reviews(first: 100) {
+          pageInfo { hasNextPage endCursor }
+          nodes { submittedAt author { login } }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Follow-up pages for the rare PR with more reviews than the search embeds.
+_PULL_REVIEWS_QUERY = """
+query($id: ID!, $cursor: String) {
+  node(id: $id) {
+    ... on PullRequest {
+      reviews(first: 100, after: $cursor) {
+        pageInfo { hasNextPage endCursor }
+        nodes { submittedAt author { login } }
+      }
+    }
+  }
+}
+"""
+
+
+def _iso_epoch(value: str) -> float:
+    return datetime.fromisoformat(value).timestamp()
+
+
+def _login(actor: Optional[Dict[str, Any]]) -> Optional[str]:
+    # GraphQL returns a null author for deleted ("ghost") accounts.
+    return actor["login"] if actor else None
+
+
+def _fetch_remaining_reviews(g: Any, node: Dict[str, Any]) -> None:
+    """Append every review page after the first to node["reviews"]["nodes"]."""
+    reviews = node["reviews"]
+    page_info = reviews["pageInfo"]
+    while page_info["hasNextPage"]:
+        _, data = g.requester.graphql_query(
+            _PULL_REVIEWS_QUERY,
+            {"id": node["id"], "cursor": page_info["endCursor"]},
+        )
+        page = data["data"]["node"]["reviews"]
+        reviews["nodes"].extend(page["nodes"])
+        page_info = page["pageInfo"]
+
+
+def _pull_record(node: Dict[str, Any]) -> PullRequestRecord:
+    return PullRequestRecord(
+        number=node["number"],
+        author=_login(node["author"]),
+        is_open=node["state"] == "OPEN",
+        merged=node["merged"],
+        created_ts=_iso_epoch(node["createdAt"]),
+        closed_ts=_iso_epoch(node["closedAt"]) if node["closedAt"] else None,
+        reviews=[
+            PullReview(
+                reviewer=_login(review["author"]),
+                submitted_ts=_iso_epoch(review["submittedAt"]),
+            )
+            for review in node["reviews"]["nodes"]
+            # Pending reviews have not been submitted yet.
+            if review["submittedAt"]
+        ],
+    )
+
+
+def _fetch_recent_pulls(
+    g: Any, repo: Any, start_date: datetime
+) -> List[PullRequestRecord]:
+    """
+    PRs updated at or after start_date, reviews included. The date filter runs
+    server-side in a GraphQL search, so each page of up to 100 PRs is one
+    request, with no full history pagination. Reviews come embedded; only a
+    PR with more than 100 of them needs a follow-up reviews query.
+    """
+    start_ts = start_date.timestamp()
+    query = (
+        f"repo:{repo.full_name} is:pr "
+        f"updated:>={start_date.strftime('%Y-%m-%dT%H:%M:%SZ')}"
+    )
+    pulls: List[PullRequestRecord] = []
+    cursor = None
+    try:
+        while True:
+            _, data = g.requester.graphql_query(
+                _RECENT_PULLS_QUERY, {"q": query, "cursor": cursor}
+            )
+            search = data["data"]["search"]
+            for node in search["nodes"]:
+                if node and _iso_epoch(node["updatedAt"]) >= start_ts:
+                    _fetch_remaining_reviews(g, node)
+                    pulls.append(_pull_record(node))
+            page_info = search["pageInfo"]
+            if not page_info["hasNextPage"]:
+                break
+            cursor = page_info["endCursor"]
+    except Exception as e:
+        logger.error(
+            f"Error processing PRs for {repo.name}: {e}. "
+            f"PR metrics for this repo are PARTIAL ({len(pulls)} PRs fetched)."
+        )
+    return pulls
+
+
+def _fetch_issues(repo: Any, since: datetime) -> List[Any]:
+    """Issues (excluding PRs) updated at or after `since`."""
+    issues: List[Any] = []
+    try:
+        for issue in repo.get_issues(state="all", since=since):
+            if not issue.pull_request:
+                issues.append(issue)
+    except Exception as e:
+        logger.error(f"Error processing issues for {repo.name}: {e}")
+    return issues
 
 
 class GithubService:
@@ -34,123 +194,144 @@ class GithubService:
     ) -> Tuple[RawTeamMetrics, Dict[str, Dict[str, int]]]:
         """
         Retrieves and aggregates GQM metrics for a specific team over a date range.
+
+        GitHub calls (repos, PR searches, issue pages) are fanned out over a
+        thread pool; aggregation then runs serially on this thread.
         """
         logger.info(f"--- Processing {team_name} ---")
 
+        # All date math below is done on epoch seconds to avoid building
+        # tz-aware datetimes per PR/issue/review.
+        start_ts = start_date.timestamp()
+        end_ts = end_date.timestamp()
+
         g = self.client.client
-        repos = []
-        for r in config.repos:
-            try:
-                repos.append(g.get_repo(r))
-            except Exception as e:
-                logger.error(f"Error fetching repo {r}: {e}")
+        with ThreadPoolExecutor(max_workers=GITHUB_MAX_WORKERS) as executor:
+            repos = [
+                repo
+                for repo in executor.map(lambda r: _fetch_repo(g, r), config.repos)
+                if repo is not None
+            ]
+            # Executor.map submits eagerly, so PR and issue listings overlap.
+            pulls_by_repo = executor.map(
+                lambda repo: _fetch_recent_pulls(g, repo, start_date), repos
+            )
+            issues_by_repo = executor.map(
+                lambda repo: _fetch_issues(repo, start_date), repos
+            )
+            pulls = [
+                (repo, pr)
+                for repo, repo_pulls in zip(repos, pulls_by_repo)
+                for pr in repo_pulls
+            ]
+            issues = [
+                (repo, issue)
+                for repo, repo_issues in zip(repos, issues_by_repo)
+                for issue in repo_issues
+            ]
 
         members = set(config.members)
         leads = set(config.tech_leads)
         non_leads = members - leads
         metrics = RawTeamMetrics()
 
+        # Hot-loop accumulators live in locals and are written back once at the end
+        velocity_merged_prs = 0
+        velocity_issues_closed = 0
+        non_lead_reviews = 0
+        npo_features_closed = 0
+        cycle_times = metrics.velocity_cycle_times
+        npo_time_to_close = metrics.npo_time_to_close
+        pr_authors = metrics.participation_pr_authors
+        stale_prs = metrics.alerts_stale_prs
+        stale_issues = metrics.alerts_stale_issues
+
+        # Per-member counters as parallel lists indexed by member_idx
+        member_idx = {m: i for i, m in enumerate(members)}
+        prs_opened = [0] * len(member_idx)
+        prs_merged = [0] * len(member_idx)
+        reviews = [0] * len(member_idx)
+
+        for repo, pr in pulls:
+            pr_created_ts = pr.created_ts
+            pr_closed_ts = pr.closed_ts
+            author_idx = member_idx.get(pr.author)
+
+            # --- Alert: Stale PRs (Open > 7 days) ---
+            if pr.is_open:
+                days_open = int((end_ts - pr_created_ts) // SECONDS_PER_DAY)
+                if days_open > STALE_PR_DAYS:
+                    stale_prs.append(f"{repo.name}#{pr.number} ({days_open} days)")
+
+            # --- Metric: PRs Opened this week ---
+            if start_ts <= pr_created_ts <= end_ts:
+                if author_idx is not None:
+                    prs_opened[author_idx] += 1
+                    pr_authors.add(pr.author)
+
+            # --- Metric: Velocity (Merged PRs) ---
+            if (
+                pr.merged
+                and pr_closed_ts is not None
+                and (start_ts <= pr_closed_ts <= end_ts)
+            ):
+                velocity_merged_prs += 1
+                if author_idx is not None:
+                    prs_merged[author_idx] += 1
+
+                # Cycle Time (Open -> Merged)
+                cycle_time = (pr_closed_ts - pr_created_ts) / SECONDS_PER_HOUR  # hours
+                cycle_times.append(cycle_time)
+
+            # --- Metric: Non-Lead Reviews ---
+            for review in pr.reviews:
+                if start_ts <= review.submitted_ts <= end_ts:
+                    reviewer = review.reviewer
+                    if reviewer in non_leads:
+                        non_lead_reviews += 1
+                    reviewer_idx = member_idx.get(reviewer)
+                    if reviewer_idx is not None:
+                        reviews[reviewer_idx] += 1
+
+        for repo, issue in issues:
+            issue_created_ts = _epoch(issue.created_at)
+            issue_closed_ts = _epoch(issue.closed_at) if issue.closed_at else None
+            labels = [l.name for l in issue.labels]
+
+            # --- Alert: Stale Issues (No activity > 10 days) ---
+            if issue.state == "open":
+                days_inactive = int(
+                    (end_ts - _epoch(issue.updated_at)) // SECONDS_PER_DAY
+                )
+                if days_inactive > STALE_ISSUE_DAYS:
+                    stale_issues.append(f"{repo.name}#{issue.number}")
+
+            # --- Metric: Issues Closed ---
+            if issue_closed_ts is not None and (start_ts <= issue_closed_ts <= end_ts):
+                velocity_issues_closed += 1
+
+                # NPO Value Check
+                if NPO_LABEL in labels:
+                    npo_features_closed += 1
+                    time_to_close = (
+                        issue_closed_ts - issue_created_ts
+                    ) / SECONDS_PER_HOUR  # hours
+                    npo_time_to_close.append(time_to_close)
+
+        metrics.velocity_merged_prs = velocity_merged_prs
+        metrics.velocity_issues_closed = velocity_issues_closed
+        metrics.participation_non_lead_reviews = non_lead_reviews
+        metrics.npo_features_closed = npo_features_closed
+
         member_activity = {
-            m: {"prs_merged": 0, "prs_opened": 0, "reviews": 0} for m in members
+            m: {
+                "prs_merged": prs_merged[i],
+                "prs_opened": prs_opened[i],
+                "reviews": reviews[i],
+            }
+            for m, i in member_idx.items()
         }
 
-        for repo in repos:
-            try:
-                prs = repo.get_pulls(state="all", sort="updated", direction="desc")
-
-                for pr in prs:
-                    if pr.updated_at.replace(tzinfo=timezone.utc) < start_date:
-                        break
-
-                    pr_created = pr.created_at.replace(tzinfo=timezone.utc)
-                    pr_closed = (
-                        pr.closed_at.replace(tzinfo=timezone.utc)
-                        if pr.closed_at
-                        else None
-                    )
-                    is_member_pr = pr.user.login in members
-
-                    # --- Alert: Stale PRs (Open > 7 days) ---
-                    if pr.state == "open":
-                        days_open = (datetime.now(timezone.utc) - pr_created).days
-                        if days_open > STALE_PR_DAYS:
-                            metrics.alerts_stale_prs.append(
-                                f"{repo.name}#{pr.number} ({days_open} days)"
-                            )
-
-                    # --- Metric: PRs Opened this week ---
-                    if start_date <= pr_created <= end_date:
-                        if is_member_pr:
-                            member_activity[pr.user.login]["prs_opened"] += 1
-                            metrics.participation_pr_authors.add(pr.user.login)
-
-                    # --- Metric: Velocity (Merged PRs) ---
-                    if (
-                        pr.merged
-                        and pr_closed
-                        and (start_date <= pr_closed <= end_date)
-                    ):
-                        metrics.velocity_merged_prs += 1
-                        if is_member_pr:
-                            member_activity[pr.user.login]["prs_merged"] += 1
-
-                        # Cycle Time (Open -> Merged)
-                        cycle_time = (
-                            pr_closed - pr_created
-                        ).total_seconds() / 3600  # hours
-                        metrics.velocity_cycle_times.append(cycle_time)
-
-                    # --- Metric: Non-Lead Reviews ---
-                    for review in pr.get_reviews():
-                        rev_date = review.submitted_at.replace(tzinfo=timezone.utc)
-                        if start_date <= rev_date <= end_date:
-                            reviewer = review.user.login
-                            if reviewer in non_leads:
-                                metrics.participation_non_lead_reviews += 1
-                            if reviewer in members:
-                                member_activity[reviewer]["reviews"] += 1
-            except Exception as e:
-                logger.error(f"Error processing PRs for {repo.name}: {e}")
-            try:
-                issues = repo.get_issues(state="all", since=start_date)
-
-                for issue in issues:
-                    if issue.pull_request:
-                        continue
-
-                    issue_created = issue.created_at.replace(tzinfo=timezone.utc)
-                    issue_closed = (
-                        issue.closed_at.replace(tzinfo=timezone.utc)
-                        if issue.closed_at
-                        else None
-                    )
-                    labels = [l.name for l in issue.labels]
-
-                    # --- Alert: Stale Issues (No activity > 10 days) ---
-                    if issue.state == "open":
-                        days_inactive = (
-                            datetime.now(timezone.utc)
-                            - issue.updated_at.replace(tzinfo=timezone.utc)
-                        ).days
-                        if days_inactive > STALE_ISSUE_DAYS:
-                            metrics.alerts_stale_issues.append(
-                                f"{repo.name}#{issue.number}"
-                            )
-
-                    # --- Metric: Issues Closed ---
-                    if issue_closed and (start_date <= issue_closed <= end_date):
-                        metrics.velocity_issues_closed += 1
-
-                        # NPO Value Check
-                        if NPO_LABEL in labels:
-                            metrics.npo_features_closed += 1
-                            time_to_close = (
-                                issue_closed - issue_created
-                            ).total_seconds() / 3600  # hours
-                            metrics.npo_time_to_close.append(time_to_close)
-            except Exception as e:
-                logger.error(f"Error processing issues for {repo.name}: {e}")
-
         return metrics, member_activity
 
     def generate_weekly_metrics(
@@ -169,14 +350,12 @@ class GithubService:
             )
 
             avg_cycle_time = (
-                (sum(metrics.velocity_cycle_times) / len(metrics.velocity_cycle_times))
+                fmean(metrics.velocity_cycle_times)
                 if metrics.velocity_cycle_times
                 else 0.0
             )
             avg_npo_time = (
-                (sum(metrics.npo_time_to_close) / len(metrics.npo_time_to_close))
-                if metrics.npo_time_to_close
-                else 0.0
+                fmean(metrics.npo_time_to_close) if metrics.npo_time_to_close else 0.0
             )
             participation_rate = (
                 (len(metrics.participation_pr_authors) / len(team_config.members)) * 100
@@ -1,18 +1,25 @@
 from typing import Any
-import re
 import os
 import logging
-import logging
-import json
-import boto3
+import orjson
+from functools import lru_cache
 
-_CURRENCY_RE = re.compile(r"[,\s$]")
 CONFIG_SECRET_ARN = "METRICS_CONFIG_SECRET_ARN"
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-secrets_client = boto3.client("secretsmanager")
+
+@lru_cache(maxsize=None)
+def _secrets_client() -> Any:
+    import boto3
+    from botocore.config import Config
+
+    # Bound tail latency: one retry, with client-side rate adaptation.
+    return boto3.client(
+        "secretsmanager",
+        config=Config(retries={"total_max_attempts": 2, "mode": "adaptive"}),
+    )
 
 
 def safe_get_env(var_name: str) -> str:
@@ -27,13 +34,16 @@ def is_var_in_env(var_name: str) -> bool:
     return var_name in os.environ
 
 
+# Cached for the lifetime of the execution environment: warm invocations reuse
+# the parsed config, and a secret update takes effect on the next cold start.
+@lru_cache(maxsize=1)
 def load_config_from_secrets() -> dict:
     secret_arn = safe_get_env(CONFIG_SECRET_ARN)
     try:
         logger.info(f"Fetching secret value from ARN: {secret_arn}")
-        response = secrets_client.get_secret_value(SecretId=secret_arn)
+        response = _secrets_client().get_secret_value(SecretId=secret_arn)
         secret_string = response.get("SecretString")
-        config_data = json.loads(secret_string)
+        config_data = orjson.loads(secret_string)
         logger.info("Successfully loaded configuration from Secrets Manager")
         return config_data
     except Exception as e:
@@ -42,8 +52,8 @@ def load_config_from_secrets() -> dict:
 
 
 def load_config_from_file(file_path: str) -> dict:
-    with open(file_path, "r") as f:
-        return json.load(f)
+    with open(file_path, "rb") as f:
+        return orjson.loads(f.read())
 
 
 def _to_float(x: Any) -> float:
@@ -93,8 +103,8 @@ def _as_float(value: Any, default: float) -> float:
         negative = True
         s = s[1:-1].strip()
 
-    # Remove $, commas, spaces
-    s = _CURRENCY_RE.sub("", s)
+    # Remove $, commas, spaces (split() drops the same whitespace set as \s)
+    s = "".join(s.replace(",", "").replace("$", "").split())
 
     # Optional: handle percent (e.g., "12%" -> 12.0 or 0.12 depending on what you want)
     if s.endswith("%"):